@@ -137,15 +137,17 @@ def demo_weakref_finalize() -> None:
 # 5) atexit: BEST-EFFORT, NOT A GUARANTEE
 # ----------------------------------------
 
-def atexit_handler() -> None:
+def atexit_handler(gc_enabled: bool) -> None:
+    # Everything the handler needs is passed in at registration time,
+    # so it does not have to reach into the gc module during shutdown.
     print("[atexit_handler] interpreter exiting")
-    print("gc.isenabled():", gc.isenabled())
+    print("gc.isenabled() at registration:", gc_enabled)
 
 
 def demo_atexit() -> None:
     print("=== demo_atexit ===")
 
-    atexit.register(atexit_handler)
+    atexit.register(atexit_handler, gc.isenabled())
     print("atexit handler registered")
     print(
         "atexit runs late in shutdown, "
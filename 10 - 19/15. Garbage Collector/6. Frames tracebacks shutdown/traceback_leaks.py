@@ -11,6 +11,7 @@ This module explains:
 
 from __future__ import annotations
 
+from contextlib import suppress
 from typing import Any
 import sys
 import gc
@@ -128,7 +129,25 @@ def fix_by_bare_except() -> None:
 
 
 # ----------------------------------------
-# 7) LIMITATION: CLEARING TRACEBACK IS NOT ENOUGH
+# 7) FIX 3: contextlib.suppress
+# ----------------------------------------
+
+def fix_by_suppress() -> None:
+    print("=== fix_by_suppress ===")
+
+    # contextlib.suppress is the explicit form of `except Exception: pass`.
+    # The exception object is never bound to a name in this frame,
+    # so there is no `e` that could keep the traceback alive.
+    with suppress(Exception):
+        obj = BigObject(1_000_000)
+        raise KeyError("boom")
+
+    print("GC collect:", gc.collect())
+    print()
+
+
+# ----------------------------------------
+# 8) LIMITATION: CLEARING TRACEBACK IS NOT ENOUGH
 # ----------------------------------------
 #
 # IMPORTANT:
@@ -163,7 +182,7 @@ def clearing_traceback_is_not_enough() -> None:
 
 
 # ----------------------------------------
-# 8) FIX: CLEAR TRACEBACK AFTER FRAME EXIT
+# 9) FIX: CLEAR TRACEBACK AFTER FRAME EXIT
 # ----------------------------------------
 #
 # Here we ensure that the frame holding `obj` has already finished
@@ -197,7 +216,7 @@ def fix_clear_traceback_after_frame_exit() -> None:
 
 
 # ----------------------------------------
-# 9) WHY THIS HAPPENS (SUMMARY)
+# 10) WHY THIS HAPPENS (SUMMARY)
 # ----------------------------------------
 #
 # - traceback objects reference frames
@@ -213,18 +232,18 @@ def fix_clear_traceback_after_frame_exit() -> None:
 
 
 # ----------------------------------------
-# 10) PRACTICAL RULES
+# 11) PRACTICAL RULES
 # ----------------------------------------
 #
 # 1) Avoid long-lived exception objects
-# 2) Prefer bare `except` if exception object is unused
+# 2) Prefer bare `except` (or contextlib.suppress) if exception object is unused
 # 3) Explicitly `del e` in long-running loops
 # 4) Be careful with logging systems that store exceptions
 # 5) Use tracemalloc / gc.get_referrers when debugging leaks
 
 
 # ----------------------------------------
-# 11) QUICK RUN
+# 12) QUICK RUN
 # ----------------------------------------
 
 if __name__ == "__main__":
@@ -239,6 +258,9 @@ if __name__ == "__main__":
     fix_by_bare_except()
     verify_leak()
 
+    fix_by_suppress()
+    verify_leak()
+
     clearing_traceback_is_not_enough()
     verify_leak()
 
@@ -67,7 +67,7 @@ def except_exception_demo() -> None:
 def silent_except_demo() -> None:
     print("=== silent_except_demo ===")
 
-    numbers: list[str] = ["1", "x", "3"]
+    numbers: tuple[str, ...] = ("1", "x", "3")
 
     results: list[int] = []
 
@@ -130,8 +130,9 @@ def exception_as_control_flow_demo() -> None:
 # ----------------------------------------
 # 6) LOSING ORIGINAL EXCEPTION CONTEXT
 # ----------------------------------------
-# Raising a new exception without chaining
-# destroys valuable debugging information.
+# Raising a new exception without chaining keeps the original
+# only implicitly, as __context__, and hides whether the new
+# error was intentional.
 
 def lost_context_demo() -> None:
     print("=== lost_context_demo ===")
@@ -139,12 +140,38 @@ def lost_context_demo() -> None:
     try:
         int("invalid")
     except ValueError:
-        # The original ValueError is lost here.
+        # The original ValueError is only attached implicitly
+        # as __context__ ("During handling of the above exception...").
+        # The traceback no longer says whether the new error
+        # was intentional or a bug inside the handler.
         raise RuntimeError("Parsing failed")
 
     print()
 
 
+def explicit_context_demo() -> None:
+    print("=== explicit_context_demo ===")
+
+    # The fix is to state the intent explicitly:
+    #   - `raise ... from exc` keeps the original error as __cause__
+    #   - `raise ... from None` drops it on purpose
+    #
+    # The name bound by `except ... as exc` is deleted automatically
+    # when the except block ends, so the caught exception does not
+    # keep the current frame (and its locals) alive.
+
+    try:
+        try:
+            int("invalid")
+        except ValueError as exc:
+            raise RuntimeError("Parsing failed") from exc
+    except RuntimeError as error:
+        print(f"Caught: {error!r}")
+        print(f"Cause:  {error.__cause__!r}")
+
+    print()
+
+
 # ----------------------------------------
 # 7) WHAT THESE MISTAKES HAVE IN COMMON
 # ----------------------------------------
@@ -173,6 +200,7 @@ if __name__ == "__main__":
     silent_except_demo()
     wide_try_block_demo()
     exception_as_control_flow_demo()
+    explicit_context_demo()
 
     # lost_context_demo() is intentionally NOT executed here,
     # because it raises an unhandled exception and terminates the program.
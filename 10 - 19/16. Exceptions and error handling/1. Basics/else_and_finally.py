@@ -24,7 +24,7 @@ from __future__ import annotations
 def try_except_else_demo() -> None:
     print("=== try_except_else_demo ===")
 
-    raw_values: list[str] = ["10", "invalid", "20"]
+    raw_values: tuple[str, ...] = ("10", "invalid", "20")
 
     for raw in raw_values:
         try:
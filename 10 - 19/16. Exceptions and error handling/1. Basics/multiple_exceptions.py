@@ -59,7 +59,7 @@ def multiple_except_clauses_demo() -> None:
 def except_order_demo() -> None:
     print("=== except_order_demo ===")
 
-    values: list[str | None] = ["5", None, "invalid"]
+    values: tuple[str | None, ...] = ("5", None, "invalid")
 
     for value in values:
         try:
@@ -90,7 +90,7 @@ def except_order_demo() -> None:
 def grouped_exceptions_demo() -> None:
     print("=== grouped_exceptions_demo ===")
 
-    inputs: list[str | None] = ["42", None, "oops"]
+    inputs: tuple[str | None, ...] = ("42", None, "oops")
 
     for item in inputs:
         try:
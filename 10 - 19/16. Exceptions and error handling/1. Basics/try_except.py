@@ -58,7 +58,7 @@ def basic_try_except_demo() -> None:
 def narrow_try_block_demo() -> None:
     print("=== narrow_try_block_demo ===")
 
-    values: list[str] = ["10", "20", "not_a_number", "40"]
+    values: tuple[str, ...] = ("10", "20", "not_a_number", "40")
 
     for value in values:
         try:
@@ -77,6 +77,32 @@ def narrow_try_block_demo() -> None:
     print()
 
 
+def precheck_instead_of_try_demo() -> None:
+    print("=== precheck_instead_of_try_demo ===")
+
+    # When invalid values are rare, the try/except above is the right tool.
+    # When invalid values dominate, every bad item pays for building
+    # and raising a ValueError.
+    #
+    # A cheap string pre-check skips int() for obviously bad input.
+    # Caveat: str.isdigit() is not an exact model of int():
+    #   - it rejects "+5" and " 5 " (int() accepts both)
+    #   - it accepts "²" (int() rejects it)
+    # so this is only safe for inputs with a known, simple format.
+
+    values: tuple[str, ...] = ("10", "20", "not_a_number", "-40")
+
+    for value in values:
+        if not value.removeprefix("-").isdigit():
+            print(f"Skipping invalid value: {value}")
+            continue
+
+        number: int = int(value)
+        print(f"{number} -> {number * 2}")
+
+    print()
+
+
 # ----------------------------------------
 # 3) MULTIPLE OPERATIONS VS MULTIPLE FAILURES
 # ----------------------------------------
@@ -145,4 +171,5 @@ def multiple_failure_sources_demo() -> None:
 if __name__ == "__main__":
     basic_try_except_demo()
     narrow_try_block_demo()
+    precheck_instead_of_try_demo()
     multiple_failure_sources_demo()
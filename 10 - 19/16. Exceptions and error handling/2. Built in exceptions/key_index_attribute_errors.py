@@ -168,6 +168,13 @@ def attribute_error_and_duck_typing_demo() -> None:
 # 7) KEY / INDEX / ATTRIBUTE — SUMMARY
 # ----------------------------------------
 
+LOOKUP_ERROR_EXAMPLES: tuple[tuple[str, type[BaseException]], ...] = (
+    ("{'a': 1}['b']", KeyError),
+    ("[1, 2, 3][10]", IndexError),
+    ("42.foo", AttributeError),
+)
+
+
 def key_index_attribute_summary_demo() -> None:
     print("=== key_index_attribute_summary_demo ===")
 
@@ -183,14 +190,8 @@ def key_index_attribute_summary_demo() -> None:
     # All three signal:
     # "The container/object exists, but the lookup failed"
 
-    examples: list[tuple[str, BaseException]] = [
-        ("{'a': 1}['b']", KeyError("b")),
-        ("[1, 2, 3][10]", IndexError("list index out of range")),
-        ("42.foo", AttributeError("'int' object has no attribute 'foo'")),
-    ]
-
-    for expression, error in examples:
-        print(f"{expression} -> {type(error).__name__}")
+    for expression, error_type in LOOKUP_ERROR_EXAMPLES:
+        print(f"{expression} -> {error_type.__name__}")
 
     print()
 
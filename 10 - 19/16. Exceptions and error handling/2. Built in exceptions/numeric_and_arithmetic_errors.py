@@ -141,6 +141,13 @@ def arithmetic_error_hierarchy_demo() -> None:
 # 6) NUMERIC ERRORS VS TYPE AND VALUE ERRORS
 # ----------------------------------------
 
+NUMERIC_ERROR_EXAMPLES: tuple[tuple[str, type[BaseException]], ...] = (
+    ("1 / 0", ZeroDivisionError),
+    ("1 + '2'", TypeError),
+    ("int('abc')", ValueError),
+)
+
+
 def numeric_error_comparison_demo() -> None:
     print("=== numeric_error_comparison_demo ===")
 
@@ -151,14 +158,8 @@ def numeric_error_comparison_demo() -> None:
     # Here, the operands are numeric and valid,
     # but the operation itself violates mathematical rules.
 
-    examples: list[tuple[str, BaseException]] = [
-        ("1 / 0", ZeroDivisionError()),
-        ("1 + '2'", TypeError()),
-        ("int('abc')", ValueError()),
-    ]
-
-    for expression, error in examples:
-        print(f"{expression} -> {type(error).__name__}")
+    for expression, error_type in NUMERIC_ERROR_EXAMPLES:
+        print(f"{expression} -> {error_type.__name__}")
 
     print()
 
@@ -132,6 +132,16 @@ def stop_iteration_demo() -> None:
     except StopIteration:
         print("StopIteration caught: iterator exhausted")
 
+    # In real code, let a for loop drive the iterator.
+    #
+    # The loop detects exhaustion inside the iteration protocol.
+    # For built-in iterators no StopIteration object is even created,
+    # so the end of the loop is a plain branch, not exception handling.
+
+    for value in iter([1, 2, 3]):
+        print(value)
+    print("for loop finished: iterator exhausted")
+
     print()
 
 
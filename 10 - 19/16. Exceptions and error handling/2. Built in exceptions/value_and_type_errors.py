@@ -107,6 +107,12 @@ def type_error_call_signature_demo() -> None:
 # 5) ValueError VS TypeError — SUMMARY
 # ----------------------------------------
 
+VALUE_TYPE_ERROR_EXAMPLES: tuple[tuple[str, type[Exception]], ...] = (
+    ("int('abc')", ValueError),
+    ("1 + '2'", TypeError),
+)
+
+
 def value_vs_type_error_summary_demo() -> None:
     print("=== value_vs_type_error_summary_demo ===")
 
@@ -122,13 +128,8 @@ def value_vs_type_error_summary_demo() -> None:
     # This distinction is important when designing APIs
     # and especially important for custom exceptions.
 
-    examples: list[tuple[str, Exception]] = [
-        ("int('abc')", ValueError("invalid literal for int()")),
-        ("1 + '2'", TypeError("unsupported operand type(s)")),
-    ]
-
-    for expression, error in examples:
-        print(f"{expression} -> {error.__class__.__name__}")
+    for expression, error_type in VALUE_TYPE_ERROR_EXAMPLES:
+        print(f"{expression} -> {error_type.__name__}")
 
     print()
 
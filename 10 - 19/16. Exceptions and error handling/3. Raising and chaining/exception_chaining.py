@@ -159,7 +159,40 @@ def suppress_context_demo() -> None:
 
 
 # ----------------------------------------
-# 6) QUICK-RUN
+# 6) ADDING CONTEXT WITHOUT A NEW EXCEPTION
+# ----------------------------------------
+
+def add_note_demo() -> None:
+    print("=== add_note_demo ===")
+
+    # Chaining creates a second exception object.
+    # That is the right tool when the exception type changes
+    # at an abstraction boundary.
+    #
+    # When the type stays the same and only context is missing,
+    # Python 3.11+ allows attaching a note to the original exception
+    # and re-raising it with a bare `raise`.
+    #
+    # The original object and its traceback are kept as they are.
+
+    def load_port(value: str) -> int:
+        try:
+            return int(value)
+        except ValueError as exc:
+            exc.add_note(f"while loading port from {value!r}")
+            raise
+
+    try:
+        load_port("eighty")
+    except ValueError as exc:
+        print(f"Caught exception: {exc}")
+        print(f"Notes: {exc.__notes__}")
+
+    print()
+
+
+# ----------------------------------------
+# 7) QUICK-RUN
 # ----------------------------------------
 
 if __name__ == "__main__":
@@ -168,3 +201,4 @@ if __name__ == "__main__":
     root_cause_preservation_demo()
     when_not_to_chain_demo()
     suppress_context_demo()
+    add_note_demo()
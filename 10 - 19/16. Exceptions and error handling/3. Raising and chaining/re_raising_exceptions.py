@@ -7,6 +7,8 @@ and how re-raising differs from swallowing or transforming errors.
 
 from __future__ import annotations
 
+from pathlib import Path
+
 
 # ----------------------------------------
 # 1) SIMPLE RE-RAISE (DO NOT SWALLOW ERRORS)
@@ -51,8 +53,7 @@ def swallowing_exception_demo() -> None:
 
     def read_number(path: str) -> int:
         try:
-            with open(path) as file:
-                return int(file.read())
+            return int(Path(path).read_bytes())
         except (FileNotFoundError, ValueError):
             # Swallowing the exception hides the real problem.
             # The caller cannot distinguish:
@@ -115,8 +116,7 @@ def reraise_vs_new_exception_demo() -> None:
 
     def read_positive_int(path: str) -> int:
         try:
-            with open(path) as file:
-                value: int = int(file.read())
+            value: int = int(Path(path).read_bytes())
         except FileNotFoundError:
             print("File missing")
             raise
@@ -149,6 +149,11 @@ def default_reraise_policy_demo() -> None:
     # - or fully handle the error
     #
     # then re-raising is the correct default behavior.
+    #
+    # If callers probe for files that are usually missing,
+    # a Path.exists() pre-check avoids raising on every miss,
+    # at the cost of a race between the check and the open.
+    # See io_error_vs_precheck_demo in io_errors.py for both options.
 
     def open_resource(path: str) -> None:
         try:
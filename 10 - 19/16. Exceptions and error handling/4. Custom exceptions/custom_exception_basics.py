@@ -127,7 +127,28 @@ def catching_custom_exception_demo() -> None:
 
 
 # ----------------------------------------
-# 5) QUICK-RUN
+# 5) WHY NOT PRE-BUILD EXCEPTION INSTANCES? (THEORY ONLY)
+# ----------------------------------------
+
+# It is tempting to create an exception once at module level
+# and raise the same instance every time:
+#
+# NEGATIVE_AGE_ERROR = InvalidUserInputError("User age cannot be negative")
+# ...
+# raise NEGATIVE_AGE_ERROR
+#
+# This saves one small allocation per raise, but it breaks exceptions:
+# - each raise prepends new frames to the SAME __traceback__,
+#   so the traceback grows with every raise and keeps old frames alive
+# - __context__ and __cause__ are overwritten by whichever raise ran last
+# - two threads raising the instance at once share and corrupt its state
+#
+# Creating an exception object is cheap compared to raising it.
+# Always raise a fresh instance.
+
+
+# ----------------------------------------
+# 6) QUICK-RUN
 # ----------------------------------------
 
 if __name__ == "__main__":
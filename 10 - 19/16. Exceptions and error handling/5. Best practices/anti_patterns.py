@@ -23,8 +23,15 @@ def catching_base_exception_demo() -> None:
         # We have no idea what exactly went wrong.
         print("Something went wrong, but we do not know what")
 
-    # Correct approach (shown elsewhere in the project):
-    # catch the most specific exception possible.
+    # Correct approach: catch the most specific exception possible.
+    # Anything other than a parsing failure (e.g. a typo causing NameError)
+    # now propagates instead of being reported as "something went wrong".
+    try:
+        parsed: int = int("not-a-number")
+    except ValueError as exc:
+        print("Invalid integer:", exc)
+    else:
+        print("Parsed:", parsed)
 
     print()
 
@@ -51,6 +58,14 @@ def exceptions_for_control_flow_demo() -> None:
     # - slower
     # - misleading about what is truly exceptional
 
+    # Idiomatic alternative: ask for the value with a default.
+    # No KeyError is created for the expected "missing" case.
+    maybe_value: int | None = data.get("c")
+    if maybe_value is None:
+        print("Key does not exist (dict.get)")
+    else:
+        print("Value:", maybe_value)
+
     print()
 
 
@@ -73,6 +88,16 @@ def silent_exception_demo() -> None:
     # Silent failures are extremely dangerous.
     # At minimum, exceptions should be logged or re-raised.
 
+    # When the failing condition is known in advance,
+    # check it explicitly and make the outcome visible.
+    numerator: int = 10
+    denominator: int = 0
+
+    if denominator:
+        print("Result:", numerator / denominator)
+    else:
+        print("Cannot divide: denominator is zero")
+
     print()
 
 
@@ -127,10 +152,11 @@ def losing_context_demo() -> None:
 def overly_broad_try_block_demo() -> None:
     print("=== overly_broad_try_block_demo ===")
 
+    numbers: list[int] = [1, 2, 3]
+    index: int = 10
+
     # Anti-pattern: wrapping too much code in a single try block
     try:
-        numbers: list[int] = [1, 2, 3]
-        index: int = 10
         value: int = numbers[index]
         result: float = value / 2
         print("Result:", result)
@@ -142,6 +168,16 @@ def overly_broad_try_block_demo() -> None:
     # Broad try blocks obscure which operation actually failed.
     # Prefer small, focused try blocks around the risky operation only.
 
+    # Focused version: only the indexing can fail, so only it is guarded.
+    # The ZeroDivisionError handler disappears: dividing by 2 cannot fail.
+    try:
+        item: int = numbers[index]
+    except IndexError:
+        # Only one operation is guarded, so the message can be precise.
+        print(f"Index {index} is out of range for {numbers}")
+    else:
+        print("Result:", item / 2)
+
     print()
 
 
@@ -154,5 +190,8 @@ if __name__ == "__main__":
     exceptions_for_control_flow_demo()
     silent_exception_demo()
     raising_generic_exception_demo()
-    losing_context_demo()
     overly_broad_try_block_demo()
+
+    # Raises on purpose to show the resulting traceback,
+    # so it runs last.
+    losing_context_demo()
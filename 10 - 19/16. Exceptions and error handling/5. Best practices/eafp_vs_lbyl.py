@@ -56,16 +56,50 @@ def lbyl_demo(data: dict[str, int], key: str) -> None:
 
 
 # ----------------------------------------
-# 3) COMPARISON
+# 3) dict.get WITH A SENTINEL
+# ----------------------------------------
+# For dictionary lookups there is a third option that needs neither
+# an exception nor a separate membership check: dict.get.
+#
+# A private sentinel object is used instead of None,
+# so that a stored None value is not mistaken for a missing key.
+#
+# When misses are common, this avoids creating a KeyError on every miss
+# and still performs only one hash lookup.
+
+_MISSING: object = object()
+
+
+def get_with_sentinel_demo(data: dict[str, int], key: str) -> None:
+    """
+    Demonstrate dict.get with a sentinel for dictionary access.
+    """
+    print("=== dict.get Demo ===")
+
+    value: int | object = data.get(key, _MISSING)
+    if value is _MISSING:
+        print(f"Key '{key}' not found!")
+    else:
+        print(f"Value found: {value}")
+    print()
+
+
+# ----------------------------------------
+# 4) COMPARISON
 # ----------------------------------------
 # - EAFP:
 #     * More concise
 #     * Handles race conditions better in concurrent code
 #     * Pythonic style
+#     * Cheap when the key is usually present,
+#       expensive when misses are common (an exception per miss)
 # - LBYL:
 #     * More explicit
 #     * Can prevent exceptions from occurring
 #     * Slightly more verbose
+# - dict.get:
+#     * One lookup, no exception on a miss
+#     * Only available where the API offers a default-returning variant
 
 def compare_eafp_lbyl() -> None:
     """
@@ -76,14 +110,16 @@ def compare_eafp_lbyl() -> None:
     # Existing key
     eafp_demo(sample, "a")
     lbyl_demo(sample, "a")
+    get_with_sentinel_demo(sample, "a")
 
     # Missing key
     eafp_demo(sample, "u")
     lbyl_demo(sample, "u")
+    get_with_sentinel_demo(sample, "u")
 
 
 # ----------------------------------------
-# 4) QUICK-RUN
+# 5) QUICK-RUN
 # ----------------------------------------
 
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ The focus is on practical consequences for type checkers and code design.
 
 from __future__ import annotations
 
+from typing import NoReturn
+
 
 # ----------------------------------------
 # 1) EXCEPTIONS AND TYPE NARROWING
@@ -88,6 +90,17 @@ def except_exception_typing_issue_demo() -> None:
     # From a semantic perspective, it is lying.
     # Errors are silently converted into valid-looking values.
 
+    # An honest version catches only the expected failure
+    # and makes it visible in the return type.
+    def parse_or_none(value: str) -> int | None:
+        try:
+            return int(value)
+        except ValueError:
+            return None
+
+    parsed: int | None = parse_or_none("abc")
+    print("Parsed:", parsed)
+
     print()
 
 
@@ -98,9 +111,12 @@ def except_exception_typing_issue_demo() -> None:
 def non_returning_paths_demo() -> None:
     print("=== non_returning_paths_demo ===")
 
-    def fail(message: str) -> None:
+    def fail(message: str) -> NoReturn:
         # This function never returns normally.
         # It always raises an exception.
+        #
+        # The NoReturn annotation is what tells type checkers this.
+        # With `-> None` they would assume process() can fall through.
         raise RuntimeError(message)
 
     def process(value: int) -> int:
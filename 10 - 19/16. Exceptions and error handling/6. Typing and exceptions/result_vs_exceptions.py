@@ -7,7 +7,7 @@ readability, type signatures, control flow, and cognitive load.
 
 from __future__ import annotations
 
-from typing import NamedTuple
+from typing import Callable, NamedTuple
 
 
 # ----------------------------------------
@@ -114,6 +114,28 @@ def error_propagation_cost_demo() -> None:
     else:
         print(f"Result: {result.value}")
 
+    # The propagation check can be factored into a single helper,
+    # similar to Rust's `?` operator or `and_then`.
+    #
+    # Python has no syntax for this, so every step still needs
+    # a callback, which is why this rarely beats plain exceptions.
+
+    def and_then(result: Result, fn: Callable[[int], Result]) -> Result:
+        # Narrow value to int before passing it on.
+        if result.error is not None or result.value is None:
+            return result
+        return fn(result.value)
+
+    def double_result_chained(value: str) -> Result:
+        return and_then(
+            parse_int_result(value),
+            lambda number: Result(value=number * 2, error=None),
+        )
+
+    for raw in ("21", "abc"):
+        chained = double_result_chained(raw)
+        print(f"{raw!r} -> {chained}")
+
     print()
 
 
@@ -109,7 +109,11 @@ def round_trip_demo() -> None:
 
     v1: Vector = Vector(1.0, 2.0)
 
-    reconstructed: Vector = eval(repr(v1))
+    # eval() is used only to illustrate the principle.
+    # The explicit globals dict limits the names in scope to Vector
+    # (eval() still adds __builtins__ to it).
+    # This does NOT make eval() safe on untrusted input.
+    reconstructed: Vector = eval(repr(v1), {"Vector": Vector})
 
     print(f"v1 == reconstructed: {v1 == reconstructed}")
 